@@ -0,0 +1,476 @@
+#!/usr/bin/env python3
+"""Build a standalone HTML report from compiler/clang-tidy build logs.
+
+Reads one or more build logs containing GCC/Clang style diagnostics
+(``file:line:col: severity: message [check]``), drops known noise
+(vendored submodules, suppressed checks, duplicate diagnostics), and
+writes a single self-contained HTML page with severity/check filters.
+
+Usage::
+
+    python tools/warnings_report.py --logs build.log [more.log ...] --out report.html
+"""
+
+import argparse
+import functools
+import gzip
+import html
+import json
+import operator
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from collections import defaultdict, namedtuple
+from pathlib import Path
+from string import Template
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+# Anchored at both ends so the engine fails fast on non-diagnostic lines
+# (no backtracking restarts); re.ASCII keeps \d to ASCII digits. The
+# optional drive-letter prefix covers MSVC-hosted clang logs, whose
+# paths carry an extra colon that the split fast path cannot handle.
+ROW_RE = re.compile(
+    r'^(?P<file>(?:[A-Za-z]:)?[^:\n]+):(?P<line>\d+):(?P<col>\d+): '
+    r'(?P<sev>warning|error|note): (?P<msg>.*?)(?: \[(?P<check>[^\]]+)\])?\r?$',
+    re.ASCII)
+
+# Checks that are pure noise for this codebase.
+SUPPRESS_CHECKS = {
+    'clang-diagnostic-unused-command-line-argument',
+    'misc-include-cleaner',
+    'llvmlibc-callee-namespace',
+    'llvmlibc-implementation-in-namespace',
+    'llvmlibc-restrict-system-libc-headers',
+}
+
+# Message fragments that mark diagnostics from macro expansions or
+# boilerplate that we cannot act on.
+SUPPRESS_MSG_SUBSTR = (
+    'in expansion of macro',
+    'wxDECLARE_',
+    'wxIMPLEMENT_',
+    'DECLARE_DYNAMIC_CLASS',
+    'declared but not referenced',
+    'this file is only meant to be included',
+)
+
+# One compiled alternation tests every suppression substring in a single
+# scan instead of len(SUPPRESS_MSG_SUBSTR) passes over each message.
+SUPPRESS_MSG_RE = re.compile('|'.join(map(re.escape, SUPPRESS_MSG_SUBSTR)))
+
+# Checks that fire constantly in headers without being actionable there.
+SUPPRESS_CHECKS_IN_HEADERS = frozenset({
+    'misc-definitions-in-headers',
+    'misc-use-anonymous-namespace',
+})
+
+HEADER_EXTS = ('.h', '.hpp', '.hh', '.hxx')
+
+EXCLUDED_FILES = {
+    'src/math/safe_math.h',
+}
+
+# Vendored submodules; we do not lint third-party code.
+EXCLUDED_PATH_PREFIXES = (
+    'src/easyexif/',
+    'src/nanosvg/',
+    'src/wxSimpleJSON/',
+)
+
+
+_REPO_PREFIX = str(REPO_ROOT) + os.sep
+
+
+@functools.lru_cache(maxsize=None)
+def normalize_path(p: str) -> str:
+    """Make a logged path relative to the repository root where possible.
+
+    Logs repeat the same handful of source paths thousands of times, and
+    Path.resolve() stats every component, so results are cached and the
+    common already-absolute-under-the-repo case is a plain prefix strip.
+    """
+    if p.startswith(_REPO_PREFIX) and '..' not in p:
+        return p[len(_REPO_PREFIX):].replace('\\', '/')
+    try:
+        return Path(p).resolve().relative_to(REPO_ROOT).as_posix()
+    except (OSError, ValueError):
+        return p.replace('\\', '/')
+
+
+def is_excluded_path(path: str) -> bool:
+    """Return True if the (normalized) path belongs to third-party code."""
+    # str.startswith takes the prefix tuple directly and compares in C;
+    # no need for a Python-level generator loop here.
+    return path in EXCLUDED_FILES or path.startswith(EXCLUDED_PATH_PREFIXES)
+
+
+# One parsed diagnostic. A namedtuple is roughly a quarter the size of
+# the equivalent dict per entry, which matters at million-row scale, and
+# attribute access is a C-level lookup.
+Entry = namedtuple('Entry', 'file line col sev msg check')
+
+
+def parse_one(p):
+    """Parse diagnostics out of a single log file.
+
+    Suppression rules are applied here, before an entry dict is ever
+    allocated, so noise lines cost nothing beyond the parse itself.
+    Deduplication happens in parse_logs after the per-file results are
+    merged.
+    """
+    entries = []
+    # Bind the suppression tables and hot callables to locals once;
+    # the loop below runs per line, where module-global and attribute
+    # lookups are measurable.
+    _suppress_checks = SUPPRESS_CHECKS
+    _suppress_in_headers = SUPPRESS_CHECKS_IN_HEADERS
+    _header_exts = HEADER_EXTS
+    _suppress_msg = SUPPRESS_MSG_RE.search
+    _row_match = ROW_RE.match
+    _normalize = normalize_path
+    _excluded = is_excluded_path
+    _intern = sys.intern
+    _append = entries.append
+    # Stream line-by-line; logs from long CI runs can be hundreds of
+    # megabytes and read_text() would hold the whole file plus a
+    # list of every line in memory at once.
+    with open(p, 'r', encoding='utf-8', errors='replace',
+              buffering=1 << 16) as log:
+        for line in log:
+            # Cheap substring prefilter before paying for the regex;
+            # most build-log lines are not diagnostics.
+            if (' warning:' not in line and ' error:' not in line and
+                    ' note:' not in line):
+                continue
+            # Fast path: split on the fixed file:line:col: grammar and
+            # only fall back to the regex when the split disagrees.
+            parts = line.split(':', 3)
+            if len(parts) == 4 and parts[1].isdigit() and parts[2].isdigit():
+                file, lno, col, tail = parts
+                sev, _, msg = tail.lstrip().partition(': ')
+                if sev not in ('warning', 'error', 'note'):
+                    continue
+                msg = msg.rstrip('\r\n')
+                check = ''
+                if msg.endswith(']'):
+                    open_br = msg.rfind(' [')
+                    if open_br != -1:
+                        check = msg[open_br + 2:-1]
+                        msg = msg[:open_br]
+            else:
+                m = _row_match(line)
+                if not m:
+                    continue
+                d = m.groupdict()
+                file, lno, col = d['file'], d['line'], d['col']
+                sev, msg = d['sev'], d['msg']
+                check = d['check'] or ''
+            if sev == 'note' or check in _suppress_checks:
+                continue
+            file = _normalize(file)
+            if _excluded(file):
+                continue
+            # Frozen-set membership first: it almost always misses, so
+            # the endswith tuple scan only runs for the few checks that
+            # are header-suppressed at all.
+            if check in _suppress_in_headers and file.endswith(_header_exts):
+                continue
+            if _suppress_msg(msg):
+                continue
+            # File paths and check names repeat across huge numbers of
+            # entries; interning keeps one copy alive and makes the
+            # dedup-set lookups an identity compare in the common case.
+            _append(Entry(_intern(file), int(lno), int(col),
+                          sev, msg, _intern(check)))
+    return entries
+
+
+def parse_logs(paths):
+    """Parse and deduplicate diagnostics from all of the given logs.
+
+    Single-file runs (and the default) parse sequentially; CI matrix
+    runs with many logs can opt into a process pool by setting
+    WARNINGS_REPORT_JOBS, since per-file parsing is CPU-bound and
+    independent.
+    """
+    try:
+        jobs = int(os.environ.get('WARNINGS_REPORT_JOBS', '1') or 1)
+    except ValueError:
+        # A malformed opt-in knob should not take the report down;
+        # fall back to the sequential default.
+        jobs = 1
+    if len(paths) > 1 and jobs != 1:
+        workers = jobs if jobs > 0 else os.cpu_count()
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            per_file = list(ex.map(parse_one, paths))
+    else:
+        per_file = [parse_one(p) for p in paths]
+
+    entries = []
+    seen = set()
+    for batch in per_file:
+        for e in batch:
+            # Severity is deliberately left out of the key: the same
+            # location/check/message reported at two severities (e.g.
+            # promoted by -Werror in one configuration) is one finding.
+            key = (e.file, e.line, e.col, e.check, e.msg)
+            if key in seen:
+                continue
+            seen.add(key)
+            entries.append(e)
+    return entries
+
+
+def _minify(tpl: str) -> str:
+    """Strip indentation and comment-only lines from an inline template.
+
+    Keeps the source below readable while the emitted page carries no
+    leading whitespace; newlines are preserved so // comments in the
+    page script cannot swallow following code.
+    """
+    kept = []
+    for ln in tpl.split('\n'):
+        s = ln.strip()
+        if not s or s.startswith('//'):
+            continue
+        kept.append(s)
+    return '\n'.join(kept) + '\n'
+
+
+# The page template is split where the diagnostic rows go so the report
+# can be streamed to disk without ever holding all rows in one string.
+HTML_HEAD = Template(_minify("""<!DOCTYPE html>
+<html lang="en">
+<head>
+<meta charset="utf-8">
+<title>$title</title>
+<style>
+    body { font-family: sans-serif; margin: 1em 2em; }
+    h1 { font-size: 1.4em; }
+    table { border-collapse: collapse; width: 100%; }
+    th, td { border: 1px solid #ccc; padding: 2px 6px; text-align: left; }
+    th { background: #eee; position: sticky; top: 0; }
+    tr:nth-child(even) { background: #f8f8f8; }
+    .sev-error { color: #b00; font-weight: bold; }
+    .sev-warning { color: #960; }
+    .sev-note { color: #666; }
+    .summary { margin-bottom: 1em; }
+    .summary span { margin-right: 1.5em; }
+    select { margin-right: 1em; }
+</style>
+</head>
+<body>
+<h1>$title</h1>
+<div class="summary">
+    <span><b>$total</b> diagnostics</span>
+    <span class="sev-error">$errors errors</span>
+    <span class="sev-warning">$warnings warnings</span>
+    <span class="sev-note">$notes notes</span>
+    <span>$file_count files</span>
+</div>
+<div>
+    <select id="sevFilter">
+        <option value="">All severities</option>
+        <option value="error">error</option>
+        <option value="warning">warning</option>
+        <option value="note">note</option>
+    </select>
+    <select id="checkFilter">
+        <option value="">All checks</option>
+$check_opts
+    </select>
+</div>
+<table id="diag">
+<thead>
+<tr><th>Severity</th><th>File</th><th>Line</th><th>Col</th><th>Message</th><th>Check</th></tr>
+</thead>
+<tbody>
+</tbody>
+</table>
+<h2>By check</h2>
+<table>
+<thead><tr><th>Check</th><th>Count</th><th>Examples</th></tr></thead>
+<tbody>
+$by_check_rows
+</tbody>
+</table>
+<script id="data" type="application/json">["""))
+
+HTML_TAIL = Template(_minify("""]</script>
+<script>
+    var DATA = JSON.parse(document.getElementById('data').textContent);
+    var SEV_CLASS = { error: 'sev-error', warning: 'sev-warning',
+                      note: 'sev-note' };
+    var UNCATEGORIZED = '(uncategorized)';
+    var tbody = document.querySelector('#diag tbody');
+
+    function escHtml(s) {
+        return s.replace(/&/g, '&amp;').replace(/</g, '&lt;')
+                .replace(/>/g, '&gt;').replace(/"/g, '&quot;');
+    }
+
+    function rowHtml(d) {
+        return '<tr><td class="' + SEV_CLASS[d.s] + '">' + d.s +
+               '</td><td>' + escHtml(d.f) + '</td><td>' + d.l +
+               '</td><td>' + d.o + '</td><td>' + escHtml(d.m) +
+               '</td><td>' + escHtml(d.c) + '</td></tr>';
+    }
+
+    // Rebuild only the rows that pass the filter, and append them in
+    // chunks: the first chunk paints synchronously, the rest arrive via
+    // idle callbacks so a huge report never blocks the main thread.
+    var CHUNK = 1000;
+    var renderToken = 0;
+    function render() {
+        var sev = document.getElementById('sevFilter').value;
+        var check = document.getElementById('checkFilter').value;
+        // Checkless diagnostics are listed under the UNCATEGORIZED
+        // sentinel; an empty value stays the "All checks" wildcard.
+        var wantCheck = check === UNCATEGORIZED ? '' : check;
+        var matches = [];
+        for (var i = 0; i < DATA.length; ++i) {
+            var d = DATA[i];
+            if ((!sev || d.s === sev) && (!check || d.c === wantCheck)) {
+                matches.push(d);
+            }
+        }
+        var token = ++renderToken;
+        var pos = 0;
+        tbody.innerHTML = '';
+        function appendChunk() {
+            if (token !== renderToken) {
+                return;   // a newer filter superseded this render
+            }
+            var out = [];
+            var end = Math.min(pos + CHUNK, matches.length);
+            for (; pos < end; ++pos) {
+                out.push(rowHtml(matches[pos]));
+            }
+            tbody.insertAdjacentHTML('beforeend', out.join(''));
+            if (pos < matches.length) {
+                // requestIdleCallback takes an options dictionary, not a
+                // delay, so the two schedulers need separate calls.
+                if (window.requestIdleCallback) {
+                    requestIdleCallback(appendChunk);
+                } else {
+                    setTimeout(appendChunk, 0);
+                }
+            }
+        }
+        appendChunk();
+    }
+    document.getElementById('sevFilter').addEventListener('change', render);
+    document.getElementById('checkFilter').addEventListener('change', render);
+    render();
+</script>
+</body>
+</html>
+"""))
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser(
+        description='Build an HTML report from compiler/clang-tidy logs.')
+    ap.add_argument('--logs', nargs='+', required=True,
+                    help='build log files to parse')
+    ap.add_argument('--out', default='warnings-report.html',
+                    help='output HTML file')
+    a = ap.parse_args()
+
+    items = parse_logs(a.logs)
+    # Severity has only a handful of values, so split into buckets and
+    # sort each with a C-level itemgetter key instead of one global sort
+    # whose lambda builds a six-tuple per comparison.
+    buckets = {'error': [], 'warning': [], 'note': []}
+    for it in items:
+        buckets[it.sev].append(it)
+    subkey = operator.attrgetter('file', 'line', 'col', 'check')
+    for bucket in buckets.values():
+        bucket.sort(key=subkey)
+    items = buckets['error'] + buckets['warning'] + buckets['note']
+
+    # Single stats pass with everything bound to locals; on million-row
+    # reports the repeated attribute/__missing__ lookups of
+    # Counter/defaultdict access add up.
+    sev_ct = {'error': 0, 'warning': 0, 'note': 0}
+    # Only the count and the first three examples per check are ever
+    # shown, so don't retain every entry in the by-check structure.
+    by_check = defaultdict(lambda: {'count': 0, 'ex': []})
+    files = set()
+    _sev = sev_ct
+    _bc_get = by_check.__getitem__
+    _files_add = files.add
+    for it in items:
+        _sev[it.sev] += 1
+        bc = _bc_get(it.check)
+        bc['count'] += 1
+        if len(bc['ex']) < 3:
+            bc['ex'].append(it)
+        _files_add(it.file)
+
+    esc = lambda s: html.escape(s, quote=True)
+
+    # Check names and file paths repeat across the option list and the
+    # example rows; escape each distinct value once up front.
+    esc_check = {c: esc(c) for c in by_check}
+    esc_file = {f: esc(f) for f in files}
+
+    # Checkless diagnostics (plain GCC warnings/errors) must not render
+    # as value="", which the page script treats as the "All checks"
+    # wildcard; the sentinel has to match UNCATEGORIZED in the template.
+    uncategorized = '(uncategorized)'
+
+    checks_by_count = sorted(by_check.items(), key=lambda kv: -kv[1]['count'])
+    check_opts = '\n'.join(
+        f'        <option value="{esc_check[c] or uncategorized}">'
+        f'{esc_check[c] or uncategorized} ({v["count"]})</option>'
+        for c, v in checks_by_count)
+
+    by_check_rows = []
+    for check, bc in checks_by_count:
+        examples = '<br>'.join(
+            f'{esc_file[ex.file]}:{ex.line} &mdash; {esc(ex.msg)}'
+            for ex in bc['ex'])
+        by_check_rows.append(
+            f'<tr><td>{esc_check[check] or uncategorized}</td>'
+            f'<td>{bc["count"]}</td><td>{examples}</td></tr>')
+
+    # Stream head, the JSON data blob, and tail straight to the handle;
+    # a million-row report never exists as one in-memory string.
+    outp = Path(a.out)
+    if a.out.endswith('.gz'):
+        # Row markup is highly repetitive; a .gz artifact is ~10x smaller
+        # and can be served with Content-Encoding: gzip as-is. Streaming
+        # into the compressor keeps memory flat here too.
+        writer = gzip.open(outp, 'wt', encoding='utf-8', compresslevel=6)
+    else:
+        writer = open(outp, 'w', encoding='utf-8', buffering=1 << 20)
+    with writer as out:
+        out.write(HTML_HEAD.substitute(
+            title='Wisteria warnings report',
+            total=len(items),
+            errors=sev_ct['error'],
+            warnings=sev_ct['warning'],
+            notes=sev_ct['note'],
+            file_count=len(files),
+            check_opts=check_opts,
+            by_check_rows='\n'.join(by_check_rows)))
+        write = out.write
+        dumps = json.dumps
+        sep = ''
+        for it in items:
+            blob = dumps({'s': it.sev, 'c': it.check, 'f': it.file,
+                          'l': it.line, 'o': it.col, 'm': it.msg},
+                         ensure_ascii=False, separators=(',', ':'))
+            # '<' must not appear literally inside an inline <script>.
+            write(sep + blob.replace('<', '\\u003c'))
+            sep = ',\n'
+        out.write(HTML_TAIL.substitute())
+    print(f'wrote {outp} ({len(items)} diagnostics)')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())